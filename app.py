@@ -1,241 +1,354 @@
-import pandas as pd
-import streamlit as st
-import plotly.graph_objs as go
-import joblib
-
-class EnergyConsumptionApp:
-    def __init__(self):
-        st.set_page_config(
-            page_title="Energy Insights Pro",
-            page_icon="⚡",
-            layout="wide",
-            initial_sidebar_state="expanded"
-        )
-        self.setup_custom_css()
-        self.setup_page()
-        self.load_resources()
- 
-    def setup_custom_css(self):
-        st.markdown("""
-        <style>
-        /* Custom color palette */
-        :root {
-            --primary-color: #95a5a6;      /* Gray  */
-            --secondary-color: #3498db;    /* Blue  */
-            --background-color: #f4f6f7;   /* Light background color */
-            --text-color: #2c3e50;         /* Dark text color */
-            --off-white: #bdc3c7;           /* Gray color replacing off-white */
-            --green-color: #2ecc71;        /* Green color for regression texts */
-            --blue-color: #3498db;         /* Blue color for input labels */
-            --white-color: #ffffff;        /* White color for methodology and disclaimer */
-        }
-
-        /* Ensure sidebar is on the side */
-        .css-1aumxhk {
-            position: fixed;
-            top: 0;
-            right: 0;
-            bottom: 0;
-            width: 300px;
-            padding: 20px;
-            background-color: white;
-            box-shadow: -4px 0 6px rgba(0, 0, 0, 0.1);
-            overflow-y: auto;
-            z-index: 1000;
-        }
-
-        /* Main content adjustment */
-        .css-1aehpvj {
-            margin-right: 300px;
-        }
-
-        /* Slider container styling */
-        .stSlider {
-            background-color: var(--off-white);
-            border: 2px solid var(--primary-color);
-            border-radius: 10px;
-            padding: 10px;
-            margin-bottom: 10px;
-        }
-
-        /* Slider track styling */
-        .stSlider > div > div {
-            background-color: var(--primary-color);
-            color: white;
-        }
-
-        /* Global styling */
-        body {
-            color: var(--text-color);
-            background-color: var(--background-color);
-            font-family: 'Inter', 'Segoe UI', Roboto, sans-serif;
-        }
-
-        /* Label styling for blue inputs */
-        .stSlider label,
-        .stNumberInput label,
-        .stSelectbox label,
-        .stTextInput label,
-        .stRadio label {
-            color: var(--blue-color);
-        }
-
-        /* Prediction card styling */
-        .prediction-card {
-            background-color: white;
-            border-radius: 10px;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-            padding: 20px;
-            margin-bottom: 20px;
-        }
-
-        /* Button styling */
-        .stButton > button {
-            background-color: var(--primary-color);
-            color: white;
-            border-radius: 5px;
-            transition: all 0.3s ease;
-        }
-
-        .stButton > button:hover {
-            background-color: var(--secondary-color);
-            transform: scale(1.05);
-        }
-
-        /* Linear and Ridge Regression text styling */
-        .linear-regression-text, .ridge-regression-text {
-            color: var(--green-color);
-        }
-
-        /* Methodology & Disclaimer Text */
-        .stExpander .stMarkdown {
-            color: var(--white-color) !important;
-        }
-        .stExpander .stMarkdown h3,
-        .stExpander .stMarkdown h4 {
-            color: var(--white-color) !important;
-        }
-        </style>
-        """, unsafe_allow_html=True)
- 
-    def setup_page(self):
-        st.sidebar.markdown("""
-        <div style="text-align: center; margin-bottom: 20px;">
-            <h2 style="color: #3498db;">⚡ Energy Insights Pro</h2>
-        </div>
-        <h3>Customize Prediction Parameters</h3>
-        """, unsafe_allow_html=True)
- 
-    def load_resources(self):
-        try:
-            self.linear_model = joblib.load("linear_model.pkl")
-            self.ridge_model = joblib.load("ridge_model.pkl")
-            self.feature_names = joblib.load("feature_names.pkl")
-            
-            st.toast("Models loaded successfully! 🚀", icon="✅")
-        except FileNotFoundError as e:
-            st.error(f"File not found: {e}")
-            st.stop()
-        except Exception as e:
-            st.error(f"Error loading resources: {e}")
-            st.stop()
- 
-    def run(self):
-        # Main content area
-        col1, col2 = st.columns([3, 1])
-        
-        with col1:
-            st.markdown("""
-            # 🔌 Energy Consumption Forecasting
-            Predict your energy consumption with advanced machine learning models.
-            """)
-
-        # Feature inputs in sidebar
-        voltage = st.sidebar.slider("Voltage (V)", 220.0, 255.0, 240.0, help="Adjust the voltage level")
-        global_intensity = st.sidebar.slider("Global Intensity (A)", 0.0, 20.0, 4.63, help="Set the electrical current intensity")
-        sub_metering_1 = st.sidebar.slider("Sub Metering 1 (Wh)", 0.0, 50.0, 1.12, help="Energy consumption for sub-meter 1")
-        sub_metering_2 = st.sidebar.slider("Sub Metering 2 (Wh)", 0.0, 50.0, 1.30, help="Energy consumption for sub-meter 2")
-        sub_metering_3 = st.sidebar.slider("Sub Metering 3 (Wh)", 0.0, 50.0, 6.46, help="Energy consumption for sub-meter 3")
- 
-        # DateTime inputs
-        date = st.sidebar.date_input("Select Date", value=pd.Timestamp("2024-11-28"))
-        time = st.sidebar.time_input("Select Time", value=pd.Timestamp("2024-11-28 12:00:00").time())
- 
-        # Derived features
-        date_time = pd.Timestamp.combine(date, time)
-        year, month, day, hour, minute = (
-            date_time.year,
-            date_time.month,
-            date_time.day,
-            date_time.hour,
-            date_time.minute,
-        )
-        is_holiday, light, weekday = 0, 1, date_time.weekday()
- 
-        # Prepare input data with features
-        input_data = pd.DataFrame({
-            "Global_reactive_power": [0.0],
-            "Voltage": [voltage],
-            "Global_intensity": [global_intensity],
-            "Sub_metering_1": [sub_metering_1],
-            "Sub_metering_2": [sub_metering_2],
-            "Sub_metering_3": [sub_metering_3],
-            "Year": [year],
-            "Month": [month],
-            "Day": [day],
-            "Hour": [hour],
-            "Minute": [minute],
-            "Is_holiday": [is_holiday],
-            "Light": [light],
-            "Weekday": [weekday]
-        })
- 
-        # Match input features to model's expected features
-        try:
-            input_data = input_data[self.feature_names]
-        except KeyError as e:
-            st.error(f"Missing features: {e}")
-            st.stop()
- 
-        # Predictions
-        try:
-            linear_pred = self.linear_model.predict(input_data)[0]
-            ridge_pred = self.ridge_model.predict(input_data)[0]
- 
-            # Display predictions with modern card design
-            st.markdown("""
-            <div class="prediction-card">
-                <h3 style="color: #3498db; margin-bottom: 15px;">🔮 Prediction Results</h3>
-                <div style="display: flex; justify-content: space-between;">
-                    <div style="background-color: #ecf0f1; padding: 15px; border-radius: 8px; width: 48%;">
-                        <h4 class="linear-regression-text">Linear Regression</h4>
-                        <p style="font-size: 1.5em; color: #2ecc71; font-weight: bold;">{:.2f} kW</p>
-                    </div>
-                    <div style="background-color: #ecf0f1; padding: 15px; border-radius: 8px; width: 48%;">
-                        <h4 class="ridge-regression-text">Ridge Regression</h4>
-                        <p style="font-size: 1.5em; color: #2ecc71; font-weight: bold;">{:.2f} kW</p>
-                    </div>
-                </div>
-            </div>
-            """.format(linear_pred, ridge_pred), unsafe_allow_html=True)
-        except ValueError as e:
-            st.error(f"Prediction error: {e}")
- 
-        # Information and Disclaimer
-        with st.expander("📜 Methodology & Disclaimer"):
-            st.markdown("""
-            <div style="color: white;">
-            How Our Predictions Work<br>
-                - Advanced machine learning models analyze historical energy consumption patterns<br>
-                - Two regression techniques provide robust predictions<br>
-                - Considers multiple factors like voltage, intensity, and time
-
-                Disclaimer
-                - The prediction is based on historical data and statistical models
-                - This tool provides estimations. Actual consumption may vary depending on numerous factors not captured by the model.
-            </div>
-            """, unsafe_allow_html=True)
- 
-if __name__ == "__main__":
-    app = EnergyConsumptionApp()
-    app.run()
+import datetime
+
+import numpy as np
+import streamlit as st
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _predict_kernel(x, W, b):
+        out0 = b[0]
+        out1 = b[1]
+        for i in range(x.shape[0]):
+            out0 += W[0, i] * x[i]
+            out1 += W[1, i] * x[i]
+        return out0, out1
+else:
+    def _predict_kernel(x, W, b):
+        preds = W @ x + b
+        return preds[0], preds[1]
+
+@st.cache_resource(show_spinner=False)
+def _load_models():
+    # models.npz holds just coef_/intercept_ of both regressors plus the
+    # feature order (written by export_models.py) — one mmap'd read instead
+    # of reconstructing three pickled sklearn objects.
+    data = np.load("models.npz", mmap_mode="r")
+    # FP16 is plenty for a kW figure displayed at two decimals, and one
+    # contiguous matrix means both predictions stream a quarter of the
+    # bytes the original FP64 coefficients did.
+    W = np.ascontiguousarray(np.stack([data["lin_w"], data["ridge_w"]]), dtype=np.float16)
+    b = np.stack([data["lin_b"], data["ridge_b"]]).astype(np.float16)
+    if njit is not None:
+        # numba has no float16 support on CPU, so the jit kernel computes
+        # in float32 over the already-quantized weights.
+        W, b = W.astype(np.float32), b.astype(np.float32)
+    return W, b, data["features"].tolist()
+
+_CUSTOM_CSS = """
+<style>
+/* Custom color palette */
+:root {
+    --primary-color: #95a5a6;      /* Gray  */
+    --secondary-color: #3498db;    /* Blue  */
+    --background-color: #f4f6f7;   /* Light background color */
+    --text-color: #2c3e50;         /* Dark text color */
+    --off-white: #bdc3c7;           /* Gray color replacing off-white */
+    --green-color: #2ecc71;        /* Green color for regression texts */
+    --blue-color: #3498db;         /* Blue color for input labels */
+    --white-color: #ffffff;        /* White color for methodology and disclaimer */
+}
+
+/* Ensure sidebar is on the side */
+.css-1aumxhk {
+    position: fixed;
+    top: 0;
+    right: 0;
+    bottom: 0;
+    width: 300px;
+    padding: 20px;
+    background-color: white;
+    box-shadow: -4px 0 6px rgba(0, 0, 0, 0.1);
+    overflow-y: auto;
+    z-index: 1000;
+}
+
+/* Main content adjustment */
+.css-1aehpvj {
+    margin-right: 300px;
+}
+
+/* Slider container styling */
+.stSlider {
+    background-color: var(--off-white);
+    border: 2px solid var(--primary-color);
+    border-radius: 10px;
+    padding: 10px;
+    margin-bottom: 10px;
+}
+
+/* Slider track styling */
+.stSlider > div > div {
+    background-color: var(--primary-color);
+    color: white;
+}
+
+/* Global styling */
+body {
+    color: var(--text-color);
+    background-color: var(--background-color);
+    font-family: 'Inter', 'Segoe UI', Roboto, sans-serif;
+}
+
+/* Label styling for blue inputs */
+.stSlider label,
+.stNumberInput label,
+.stSelectbox label,
+.stTextInput label,
+.stRadio label {
+    color: var(--blue-color);
+}
+
+/* Prediction card styling */
+.prediction-card {
+    background-color: white;
+    border-radius: 10px;
+    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+    padding: 20px;
+    margin-bottom: 20px;
+}
+
+/* Button styling */
+.stButton > button {
+    background-color: var(--primary-color);
+    color: white;
+    border-radius: 5px;
+    transition: all 0.3s ease;
+}
+
+.stButton > button:hover {
+    background-color: var(--secondary-color);
+    transform: scale(1.05);
+}
+
+/* Linear and Ridge Regression text styling */
+.linear-regression-text, .ridge-regression-text {
+    color: var(--green-color);
+}
+
+/* Methodology & Disclaimer Text */
+.stExpander .stMarkdown {
+    color: var(--white-color) !important;
+}
+.stExpander .stMarkdown h3,
+.stExpander .stMarkdown h4 {
+    color: var(--white-color) !important;
+}
+</style>
+"""
+
+_SIDEBAR_HEADER = """
+<div style="text-align: center; margin-bottom: 20px;">
+    <h2 style="color: #3498db;">⚡ Energy Insights Pro</h2>
+</div>
+<h3>Customize Prediction Parameters</h3>
+"""
+
+# The order the UI assembles feature values in; the permutation into the
+# model's feature order is precomputed from this at load time.
+_INPUT_ORDER = (
+    "Global_reactive_power", "Voltage", "Global_intensity",
+    "Sub_metering_1", "Sub_metering_2", "Sub_metering_3",
+    "Year", "Month", "Day", "Hour", "Minute",
+    "Is_holiday", "Light", "Weekday",
+)
+
+# The feature names the UI can supply values for
+_REQUIRED_FEATURES = frozenset(_INPUT_ORDER)
+
+_DISCLAIMER_HTML = """
+<div style="color: white;">
+How Our Predictions Work<br>
+    - Advanced machine learning models analyze historical energy consumption patterns<br>
+    - Two regression techniques provide robust predictions<br>
+    - Considers multiple factors like voltage, intensity, and time
+
+    Disclaimer
+    - The prediction is based on historical data and statistical models
+    - This tool provides estimations. Actual consumption may vary depending on numerous factors not captured by the model.
+</div>
+"""
+
+_CARD_PRE = """
+<div class="prediction-card">
+    <h3 style="color: #3498db; margin-bottom: 15px;">🔮 Prediction Results</h3>
+    <div style="display: flex; justify-content: space-between;">
+        <div style="background-color: #ecf0f1; padding: 15px; border-radius: 8px; width: 48%;">
+            <h4 class="linear-regression-text">Linear Regression</h4>
+            <p style="font-size: 1.5em; color: #2ecc71; font-weight: bold;">"""
+
+_CARD_MID = """ kW</p>
+        </div>
+        <div style="background-color: #ecf0f1; padding: 15px; border-radius: 8px; width: 48%;">
+            <h4 class="ridge-regression-text">Ridge Regression</h4>
+            <p style="font-size: 1.5em; color: #2ecc71; font-weight: bold;">"""
+
+_CARD_POST = """ kW</p>
+        </div>
+    </div>
+</div>
+"""
+
+@st.cache_data(max_entries=1024, show_spinner=False)
+def _predict(values, weights_id, _W, _b):
+    # values is the input row in feature order; weights_id keys the cache
+    # to the loaded coefficients (the underscore args are not hashed) so
+    # entries invalidate if the models are reloaded.
+    x = np.asarray(values, dtype=_W.dtype)
+    linear_pred, ridge_pred = _predict_kernel(x, _W, _b)
+    return float(linear_pred), float(ridge_pred)
+
+@st.cache_resource(show_spinner=False)
+def _inject_css():
+    st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
+
+@st.cache_resource(show_spinner=False)
+def _render_sidebar_header():
+    st.sidebar.markdown(_SIDEBAR_HEADER, unsafe_allow_html=True)
+
+@st.cache_resource(show_spinner=False)
+def _render_disclaimer():
+    st.markdown(_DISCLAIMER_HTML, unsafe_allow_html=True)
+
+class EnergyConsumptionApp:
+    def __init__(self):
+        # Page config only needs to be applied once per session
+        if not st.session_state.get("_page_configured"):
+            st.set_page_config(
+                page_title="Energy Insights Pro",
+                page_icon="⚡",
+                layout="wide",
+                initial_sidebar_state="expanded"
+            )
+            st.session_state["_page_configured"] = True
+        self.setup_custom_css()
+        self.setup_page()
+        self.load_resources()
+ 
+    def setup_custom_css(self):
+        _inject_css()
+
+    def setup_page(self):
+        _render_sidebar_header()
+
+    def load_resources(self):
+        try:
+            # Both models are plain linear regressors, so predictions reduce
+            # to W @ x + b; the stacked coefficient matrix lets one matmul
+            # produce both predictions.
+            self._W, self._b, self.feature_names = _load_models()
+
+            # Input row lives in session state so reruns mutate the same
+            # buffer in place instead of reallocating one per interaction.
+            self._feature_set = frozenset(self.feature_names)
+            if "x" not in st.session_state:
+                st.session_state["x"] = np.zeros(
+                    len(self.feature_names), dtype=self._W.dtype
+                )
+            self._x = st.session_state["x"]
+
+            # Validate once at load time instead of reindexing every rerun
+            missing = self._feature_set - _REQUIRED_FEATURES
+            if missing:
+                st.error(f"Missing features: {sorted(missing)}")
+                st.stop()
+
+            # Static permutation from UI construction order into the
+            # model's feature order: one integer gather per rerun instead
+            # of per-name lookups.
+            self._perm = np.array(
+                [_INPUT_ORDER.index(name) for name in self.feature_names],
+                dtype=np.intp,
+            )
+
+            # Warm the prediction kernel so the first user interaction
+            # doesn't pay the JIT-compilation cost when numba is installed.
+            _predict_kernel(
+                np.zeros(len(self.feature_names), dtype=self._x.dtype),
+                self._W, self._b,
+            )
+
+            if not st.session_state.setdefault("_models_loaded", False):
+                st.toast("Models loaded successfully! 🚀", icon="✅")
+                st.session_state["_models_loaded"] = True
+        except FileNotFoundError as e:
+            st.error(f"File not found: {e}")
+            st.stop()
+        except Exception as e:
+            st.error(f"Error loading resources: {e}")
+            st.stop()
+ 
+    def run(self):
+        # Main content area
+        col1, col2 = st.columns([3, 1])
+        
+        with col1:
+            st.markdown("""
+            # 🔌 Energy Consumption Forecasting
+            Predict your energy consumption with advanced machine learning models.
+            """)
+
+        # Feature inputs in sidebar, batched in a form so dragging several
+        # sliders triggers one rerun on submit instead of one per change
+        with st.sidebar.form("inputs"):
+            voltage = st.slider("Voltage (V)", 220.0, 255.0, 240.0, help="Adjust the voltage level")
+            global_intensity = st.slider("Global Intensity (A)", 0.0, 20.0, 4.63, help="Set the electrical current intensity")
+            sub_metering_1 = st.slider("Sub Metering 1 (Wh)", 0.0, 50.0, 1.12, help="Energy consumption for sub-meter 1")
+            sub_metering_2 = st.slider("Sub Metering 2 (Wh)", 0.0, 50.0, 1.30, help="Energy consumption for sub-meter 2")
+            sub_metering_3 = st.slider("Sub Metering 3 (Wh)", 0.0, 50.0, 6.46, help="Energy consumption for sub-meter 3")
+
+            # DateTime inputs
+            date = st.date_input("Select Date", value=datetime.date(2024, 11, 28))
+            time = st.time_input("Select Time", value=datetime.time(12, 0))
+
+            submitted = st.form_submit_button("Predict")
+
+        # Compute and show predictions only when the form is submitted
+        if submitted:
+            # Derived features, read straight off the date/time widgets
+            year, month, day = date.year, date.month, date.day
+            hour, minute = time.hour, time.minute
+            is_holiday, light, weekday = 0, 1, date.weekday()
+
+            # Prepare input data with features, in _INPUT_ORDER
+            raw = np.array((
+                0.0, voltage, global_intensity,
+                sub_metering_1, sub_metering_2, sub_metering_3,
+                year, month, day, hour, minute,
+                is_holiday, light, weekday,
+            ), dtype=self._x.dtype)
+
+            # Permute into the model's feature order with one integer gather;
+            # membership was already validated in load_resources.
+            np.take(raw, self._perm, out=self._x)
+
+            # Predictions
+            try:
+                # Slider steps are discretized, so repeated inputs within a
+                # session hit the memo instead of recomputing.
+                linear_pred, ridge_pred = _predict(
+                    tuple(self._x), id(self._W), self._W, self._b
+                )
+
+                # Display predictions with modern card design; only the two
+                # numeric substrings change between reruns, so interpolate them
+                # into the prebuilt template inside a stable placeholder.
+                self._pred_placeholder = st.empty()
+                self._pred_placeholder.markdown(
+                    f"{_CARD_PRE}{linear_pred:.2f}{_CARD_MID}{ridge_pred:.2f}{_CARD_POST}",
+                    unsafe_allow_html=True,
+                )
+            except ValueError as e:
+                st.error(f"Prediction error: {e}")
+
+        # Information and Disclaimer
+        with st.expander("📜 Methodology & Disclaimer"):
+            _render_disclaimer()
+ 
+if __name__ == "__main__":
+    app = EnergyConsumptionApp()
+    app.run()
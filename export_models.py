@@ -0,0 +1,42 @@
+"""One-time export of the trained regressors to models.npz.
+
+The app only needs coef_/intercept_ from the linear and ridge models,
+so serialize just those (plus the feature-name order) as raw numpy
+arrays instead of full pickled sklearn estimators. Run once after
+training: python export_models.py
+"""
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import joblib
+import numpy as np
+# Unpickling the estimators imports sklearn.linear_model lazily; do it
+# up front so the worker threads don't race the import lock.
+import sklearn.linear_model  # noqa: F401
+
+def _load_feature_names():
+    # feature_names.pkl is a plain sequence of strings, so stdlib pickle
+    # reads it without joblib's numpy-aware unpickler dispatch.
+    with open("feature_names.pkl", "rb") as f:
+        return pickle.load(f)
+
+if __name__ == "__main__":
+    # The three reads are independent and unpickling releases the GIL
+    # around the I/O, so load them concurrently.
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        linear_future = ex.submit(joblib.load, "linear_model.pkl")
+        ridge_future = ex.submit(joblib.load, "ridge_model.pkl")
+        names_future = ex.submit(_load_feature_names)
+        linear_model = linear_future.result()
+        ridge_model = ridge_future.result()
+        feature_names = names_future.result()
+
+    np.savez(
+        "models.npz",
+        lin_w=linear_model.coef_,
+        lin_b=np.float64(linear_model.intercept_),
+        ridge_w=ridge_model.coef_,
+        ridge_b=np.float64(ridge_model.intercept_),
+        features=np.array([str(name) for name in feature_names]),
+    )
+    print(f"Exported {len(feature_names)} features to models.npz")